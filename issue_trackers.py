@@ -1,19 +1,61 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple, Iterator
 import os
 import json
+import asyncio
+import random
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 try:
-    from github import Github
+    # Optional: orjson parses cache files considerably faster than stdlib json
+    from orjson import loads as _json_loads
 except ImportError:
-    raise ImportError(
-        "PyGithub package not found. Please install it with: pip install PyGithub"
-    )
+    _json_loads = json.loads
+
+if TYPE_CHECKING:
+    import aiohttp
+
+GITHUB_API_URL = "https://api.github.com"
 
 CACHE_DIR = Path("/var/tmp/terry_cache")
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Maximum number of cached issues retried at the same time
+RETRY_CONCURRENCY = 8
+# Attempts per request while GitHub is rate limiting us
+MAX_RATE_LIMIT_RETRIES = 5
+# Seconds allowed per GitHub API request, matching PyGithub's default
+REQUEST_TIMEOUT = 15
+
+# Sorted cache file names, reused until the cache directory changes
+_list_cache = {"mtime": None, "data": None}
+# Parsed cache files keyed by path, reused while (mtime_ns, size) is unchanged
+_entry_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+# Convert Terry's priority to GitHub labels
+_PRIORITY_LABELS = {
+    "P0": "priority:critical",
+    "P1": "priority:high",
+    "P2": "priority:medium",
+    "P3": "priority:low"
+}
+_SPACE_TO_DASH = str.maketrans(" ", "-")
+
+@lru_cache(maxsize=32)
+def _impact_area_label(impact_area: str) -> str:
+    """Build the GitHub label for an impact area, e.g. "Core Product (...)" -> "area:core-product"."""
+    # Remove everything in parentheses, then lowercase and replace spaces with hyphens
+    impact_area = impact_area.partition('(')[0].strip()
+    return f"area:{impact_area.lower().translate(_SPACE_TO_DASH)}"
+
+class RateLimitExceeded(Exception):
+    """Raised when GitHub rejects a request because of rate limiting."""
+
+    def __init__(self, message: str, retry_after: Optional[str] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
 class IssueCache:
     """Handle caching of failed issue creation attempts."""
     
@@ -21,7 +63,7 @@ class IssueCache:
     def cache_issue(tracker_type: str, ticket_data: Dict[str, Any]) -> str:
         """Cache a failed issue creation attempt."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        cache_file = CACHE_DIR / f"issue_{timestamp}.json"
+        cache_file = CACHE_DIR / f"issue_{tracker_type}_{timestamp}.json"
         
         cache_data = {
             "tracker_type": tracker_type,
@@ -31,29 +73,71 @@ class IssueCache:
         
         with open(cache_file, 'w') as f:
             json.dump(cache_data, f, indent=2)
+        _list_cache["mtime"] = None
             
         return str(cache_file)
 
     @staticmethod
-    def list_cached_issues() -> List[Dict[str, Any]]:
-        """List all cached issues."""
-        cached_issues = []
-        for file in CACHE_DIR.glob("issue_*.json"):
+    def _scan_cache_files() -> List[str]:
+        """Return cache file names, newest first, reusing the last scan if unchanged."""
+        mtime = CACHE_DIR.stat().st_mtime_ns
+        if _list_cache["mtime"] == mtime:
+            return _list_cache["data"]
+
+        with os.scandir(CACHE_DIR) as it:
+            names = [
+                entry.name for entry in it
+                if entry.name.startswith("issue_") and entry.name.endswith(".json")
+            ]
+        # Cache files end in _{YYYYMMDD_HHMMSS}.json, so the suffix orders them chronologically
+        names.sort(key=lambda name: name[-20:-5], reverse=True)
+
+        # Drop entries for files that no longer exist
+        paths = {os.path.join(CACHE_DIR, name) for name in names}
+        for path in _entry_cache.keys() - paths:
+            del _entry_cache[path]
+
+        _list_cache["mtime"] = mtime
+        _list_cache["data"] = names
+        return names
+
+    @staticmethod
+    def list_cached_issues(tracker_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield cached issues, newest first, optionally only those for one tracker type."""
+        prefix = f"issue_{tracker_type}_" if tracker_type else "issue_"
+        for name in IssueCache._scan_cache_files():
+            # Files cached before the tracker type was part of the name start with
+            # the timestamp and have to be parsed to tell which tracker they belong to
+            legacy = name[6].isdigit()
+            if not legacy and not name.startswith(prefix):
+                continue
+            path = os.path.join(CACHE_DIR, name)
             try:
-                with open(file, 'r') as f:
-                    data = json.load(f)
-                    data['cache_file'] = str(file)
-                    cached_issues.append(data)
+                st = os.stat(path)
+                cached = _entry_cache.get(path)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    data = cached[2]
+                else:
+                    with open(path, 'rb') as f:
+                        data = _json_loads(f.read())
+                    data['cache_file'] = path
+                    _entry_cache[path] = (st.st_mtime_ns, st.st_size, data)
+            except FileNotFoundError:
+                # Removed since the directory was scanned (e.g. retried successfully)
+                continue
             except Exception as e:
-                print(f"Warning: Failed to read cache file {file}: {e}")
-        
-        return sorted(cached_issues, key=lambda x: x['timestamp'], reverse=True)
+                print(f"Warning: Failed to read cache file {path}: {e}")
+                continue
+            if legacy and tracker_type and data.get('tracker_type') != tracker_type:
+                continue
+            yield data
 
     @staticmethod
     def remove_cache_file(cache_file: str) -> None:
         """Remove a cache file after successful issue creation."""
         try:
             Path(cache_file).unlink()
+            _list_cache["mtime"] = None
         except Exception as e:
             print(f"Warning: Failed to remove cache file {cache_file}: {e}")
 
@@ -70,6 +154,10 @@ class IssueTracker(ABC):
         """Check if the integration is properly configured and accessible."""
         pass
 
+    async def close(self) -> None:
+        """Release any resources held by the integration."""
+        pass
+
     async def create_issue_with_cache(self, ticket_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create an issue with local caching for failure recovery."""
         try:
@@ -89,6 +177,10 @@ class IssueTracker(ABC):
             }
 
 class GitHubTracker(IssueTracker):
+    # Shared across instances so concurrent requests reuse one connection pool
+    _session: Optional["aiohttp.ClientSession"] = None
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def __init__(self, token: Optional[str] = None, repo: Optional[str] = None):
         self.token = token or os.getenv("GITHUB_TOKEN")
         if not self.token:
@@ -97,49 +189,111 @@ class GitHubTracker(IssueTracker):
         self.repo_name = repo or os.getenv("GITHUB_REPO")
         if not self.repo_name:
             raise ValueError("GitHub repository not specified. Set GITHUB_REPO environment variable.")
-        
-        self.client = Github(self.token)
-        self.repo = self.client.get_repo(self.repo_name)
+
+    @cached_property
+    def client(self):
+        """PyGithub client, only needed for status checks."""
+        # Imported here so the CLI doesn't pay for PyGithub unless it's used
+        try:
+            from github import Github
+        except ImportError:
+            raise ImportError(
+                "PyGithub package not found. Please install it with: pip install PyGithub"
+            )
+        return Github(self.token)
+
+    @classmethod
+    def _get_session(cls) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it on first use."""
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "aiohttp package not found. Please install it with: pip install aiohttp"
+            )
+        loop = asyncio.get_running_loop()
+        if cls._session is None or cls._session.closed or cls._session_loop is not loop:
+            # trust_env picks up HTTP(S)_PROXY/NO_PROXY like requests did
+            cls._session = aiohttp.ClientSession(
+                trust_env=True,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            )
+            cls._session_loop = loop
+        return cls._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        session, GitHubTracker._session = GitHubTracker._session, None
+        if session is not None and not session.closed:
+            await session.close()
 
     async def create_issue(self, ticket_data: Dict[str, Any]) -> str:
         """Create an issue in GitHub."""
-        # Convert Terry's priority to GitHub labels
-        priority_labels = {
-            "P0": "priority:critical",
-            "P1": "priority:high",
-            "P2": "priority:medium",
-            "P3": "priority:low"
-        }
-        
         # Extract priority key from full priority string
         priority_key = ticket_data['priority'].split()[0]
         
-        # Clean and format the impact area for label
-        impact_area = ticket_data['impact_area']
-        # Remove everything in parentheses and special characters
-        impact_area = impact_area.split('(')[0].strip()
-        # Convert to lowercase and replace spaces with hyphens
-        impact_area = impact_area.lower().replace(' ', '-')
-        
         # Prepare labels
         labels = [
-            priority_labels.get(priority_key, "priority:medium"),
-            f"area:{impact_area}",
+            _PRIORITY_LABELS.get(priority_key, "priority:medium"),
+            _impact_area_label(ticket_data['impact_area']),
             "generated-by-terry"
         ]
         
         try:
-            # Create issue
-            issue = self.repo.create_issue(
-                title=ticket_data['title'],
-                body=self._format_description_for_github(ticket_data),
-                labels=labels
-            )
-            return issue.html_url
+            return await self._post_with_backoff(self._post_issue, {
+                "title": ticket_data['title'],
+                "body": self._format_description_for_github(ticket_data),
+                "labels": labels
+            })
         except Exception as e:
             # Add more context to the error
             raise ValueError(f"Failed to create GitHub issue: {str(e)}\nLabels: {labels}")
 
+    async def _post_issue(self, payload: Dict[str, Any]) -> str:
+        """POST a new issue to the REST API and return its URL."""
+        # Create issue through the REST API so the event loop isn't blocked
+        session = self._get_session()
+        async with session.post(
+            f"{GITHUB_API_URL}/repos/{self.repo_name}/issues",
+            json=payload,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github+json"
+            }
+        ) as response:
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                data = None
+            if not isinstance(data, dict):
+                # Empty or non-JSON body
+                data = {}
+            if response.status != 201:
+                message = f"{response.status} {data.get('message', response.reason)}"
+                # Primary limits send 403 with no remaining quota, secondary limits 403/429
+                if response.status == 429 or (
+                    response.status == 403 and (
+                        response.headers.get("x-ratelimit-remaining") == "0" or
+                        "rate limit" in message.lower()
+                    )
+                ):
+                    raise RateLimitExceeded(message, response.headers.get("retry-after"))
+                raise ValueError(message)
+        return data['html_url']
+
+    async def _post_with_backoff(self, fn, *args):
+        """Call fn, backing off exponentially with jitter while GitHub rate limits us."""
+        for attempt in range(MAX_RATE_LIMIT_RETRIES):
+            try:
+                return await fn(*args)
+            except RateLimitExceeded as e:
+                if attempt == MAX_RATE_LIMIT_RETRIES - 1:
+                    raise
+                delay = 2 ** attempt + random.random()
+                if e.retry_after and e.retry_after.isdigit():
+                    delay = max(delay, int(e.retry_after))
+                await asyncio.sleep(min(delay, 60))
+
     def _format_description_for_github(self, ticket_data: Dict[str, Any]) -> str:
         """Format the description for GitHub's markdown format."""
         # Extract scores safely with defaults
@@ -160,8 +314,8 @@ class GitHubTracker(IssueTracker):
     async def get_status(self) -> bool:
         """Check if GitHub integration is working."""
         try:
-            # Try to access the repo to verify permissions
-            self.repo.full_name
+            # Resolve the authenticated user to verify the token without loading the repo
+            self.client.get_user().login
             return True
         except Exception:
             return False
@@ -210,11 +364,30 @@ class IssueTrackerFactory:
     async def retry_cached_issues(tracker_type: str, **kwargs) -> List[Dict[str, Any]]:
         """Retry all cached issues for a specific tracker type."""
         tracker = IssueTrackerFactory.create_tracker(tracker_type, **kwargs)
-        results = []
-        
-        for cached_issue in IssueCache.list_cached_issues():
-            if cached_issue['tracker_type'] == tracker.__class__.__name__:
-                result = await tracker.retry_cached_issue(cached_issue['cache_file'])
-                results.append(result)
-        
-        return results 
\ No newline at end of file
+        cache_files = [
+            cached_issue['cache_file']
+            for cached_issue in IssueCache.list_cached_issues(tracker.__class__.__name__)
+        ]
+
+        # Retry concurrently, bounded to stay clear of GitHub's secondary rate limit
+        semaphore = asyncio.Semaphore(RETRY_CONCURRENCY)
+
+        async def retry(cache_file: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await tracker.retry_cached_issue(cache_file)
+
+        try:
+            results = await asyncio.gather(
+                *(retry(cache_file) for cache_file in cache_files),
+                return_exceptions=True
+            )
+        finally:
+            await tracker.close()
+        return [
+            result if not isinstance(result, BaseException) else {
+                "success": False,
+                "error": str(result),
+                "cache_file": cache_file
+            }
+            for cache_file, result in zip(cache_files, results)
+        ] 
\ No newline at end of file
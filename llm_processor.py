@@ -1,38 +1,56 @@
-from typing import Dict, Optional, Union
+from typing import TYPE_CHECKING, Dict, Optional, Union
 import os
+import asyncio
 from abc import ABC, abstractmethod
 import json
-from openai import AsyncOpenAI
+import re
+try:
+    # Optional: orjson parses LLM responses considerably faster than stdlib json
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-class LLMProcessor(ABC):
-    @abstractmethod
-    async def process_input(self, user_input: str) -> Dict[str, Union[str, int]]:
-        """Process natural language input and return structured ticket data."""
-        pass
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
-    @staticmethod
-    def _create_prompt(user_input: str) -> str:
-        """Create a prompt for the LLM to extract ticket information."""
-        return f"""You are Terry, a witty AI Product Manager. Create a ticket in JSON format with these fields:
+# OpenAI clients keyed by API key, shared so processors reuse one connection pool
+_client_cache: Dict[str, "AsyncOpenAI"] = {}
+
+# Trailing comma before a closing brace, which Llama tends to emit
+_TRAILING_COMMA_RE = re.compile(rb",\s*}")
+
+# Ticket extraction prompt; %s is replaced with the user request
+_PROMPT_TEMPLATE = """You are Terry, a witty AI Product Manager. Create a ticket in JSON format with these fields:
 
-{{
+{
     "title": "Technical title summarizing the task",
     "description": "Full ticket description with your usual wit and style",
     "priority": "P0/P1/P2/P3",
     "impact_area": "Core Product/User Experience/Technical Debt/Infrastructure",
-    "scores": {{
+    "scores": {
         "revenue_potential": 0-100,
         "user_impact": 0-100,
         "technical_complexity": 0-100,
         "strategic_alignment": 0-100
-    }}
-}}
+    }
+}
 
-User request: {user_input}
+User request: %s
 
 Respond with valid JSON only.
 """
 
+class LLMProcessor(ABC):
+    @abstractmethod
+    async def process_input(self, user_input: str) -> Dict[str, Union[str, int]]:
+        """Process natural language input and return structured ticket data."""
+        pass
+
+    @staticmethod
+    def _create_prompt(user_input: str) -> str:
+        """Create a prompt for the LLM to extract ticket information."""
+        return _PROMPT_TEMPLATE % user_input
+
     def _normalize_response(self, response_data: Dict) -> Dict[str, Union[str, int]]:
         """Normalize the response to match the expected format."""
         # Extract scores from nested structure if needed
@@ -63,7 +81,11 @@ class OpenAIProcessor(LLMProcessor):
             self.api_key = api_key or os.getenv("OPENAI_API_KEY")
             if not self.api_key:
                 raise ValueError("OpenAI API key not found")
-            self.client = AsyncOpenAI(api_key=self.api_key)
+            self.client = _client_cache.get(self.api_key)
+            if self.client is None:
+                # Imported here so the CLI doesn't pay for the OpenAI SDK unless it's used
+                from openai import AsyncOpenAI
+                self.client = _client_cache[self.api_key] = AsyncOpenAI(api_key=self.api_key)
         except ImportError:
             raise ImportError("OpenAI package not installed. Run: pip install openai")
 
@@ -84,21 +106,32 @@ class OpenAIProcessor(LLMProcessor):
             )
             
             response_text = response.choices[0].message.content
-            response_data = json.loads(response_text)
+            response_data = _json_loads(response_text)
             return self._normalize_response(response_data)
             
         except Exception as e:
             raise ValueError(f"Failed to process OpenAI response: {str(e)}")
 
 class LlamaProcessor(LLMProcessor):
-    def __init__(self, model_path: str):
+    def __init__(
+        self,
+        model_path: str,
+        n_gpu_layers: int = -1,
+        n_batch: int = 512,
+        use_mlock: bool = False
+    ):
         try:
             from llama_cpp import Llama
             self.llm = Llama(
                 model_path=model_path,
                 n_ctx=2048,  # Increased context window
-                n_threads=4  # Parallel processing
+                n_threads=os.cpu_count() or 4,  # Parallel processing
+                n_gpu_layers=n_gpu_layers,  # -1 offloads all layers when built with CUDA/Metal
+                n_batch=n_batch,  # Prompt tokens evaluated per batch
+                use_mlock=use_mlock  # Keep weights resident in RAM
             )
+            # llama.cpp isn't reentrant, so only one inference runs at a time
+            self._lock = asyncio.Lock()
         except ImportError:
             raise ImportError("llama-cpp-python not installed. Run: pip install llama-cpp-python")
 
@@ -110,13 +143,16 @@ class LlamaProcessor(LLMProcessor):
         prompt += "\nProvide your response as a valid JSON object and nothing else:"
         
         try:
-            response = self.llm(
-                prompt,
-                max_tokens=1000,
-                temperature=0.7,
-                stop=["}"],  # Stop at the end of JSON
-                echo=False
-            )
+            # Run inference in a worker thread so it doesn't block the event loop
+            async with self._lock:
+                response = await asyncio.to_thread(
+                    self.llm,
+                    prompt,
+                    max_tokens=1000,
+                    temperature=0.7,
+                    stop=["}"],  # Stop at the end of JSON
+                    echo=False
+                )
             
             # Clean up response text to ensure valid JSON
             response_text = response["choices"][0]["text"].strip()
@@ -124,13 +160,13 @@ class LlamaProcessor(LLMProcessor):
                 response_text += "}"
             response_text = self._format_llama_response(response_text)
             
-            response_data = json.loads(response_text)
+            response_data = _json_loads(response_text)
             return self._normalize_response(response_data)
             
         except Exception as e:
             raise ValueError(f"Failed to process Llama response: {str(e)}")
 
-    def _format_llama_response(self, text: str) -> str:
+    def _format_llama_response(self, text: str) -> bytes:
         """Clean up Llama response to ensure valid JSON."""
         # Find the first '{' and last '}'
         start = text.find('{')
@@ -139,11 +175,5 @@ class LlamaProcessor(LLMProcessor):
         if start == -1 or end == -1:
             raise ValueError("No valid JSON object found in response")
             
-        # Extract the JSON part
-        json_text = text[start:end+1]
-        
-        # Remove any trailing commas before closing braces
-        json_text = json_text.replace(',}', '}')
-        json_text = json_text.replace(',\n}', '}')
-        
-        return json_text
\ No newline at end of file
+        # Extract the JSON part and remove any trailing commas before closing braces
+        return _TRAILING_COMMA_RE.sub(b"}", text[start:end+1].encode())
\ No newline at end of file
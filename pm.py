@@ -1,22 +1,99 @@
 from enum import Enum
-import uuid
-from typing import Dict, Any, Optional
+import os
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 import random
-
-class Priority(Enum):
+from bisect import bisect_right
+try:
+    # Optional: used to score tickets in bulk in create_tickets
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from enum import StrEnum
+except ImportError:
+    # Python < 3.11
+    class StrEnum(str, Enum):
+        def __str__(self) -> str:
+            return self.value
+
+class Priority(StrEnum):
     P0 = "P0 - Drop everything and do this now!"
     P1 = "P1 - Very important, but you can finish your coffee first"
     P2 = "P2 - Important, but not as important as your weekend plans"
     P3 = "P3 - We'll get to it when we get to it"
 
-class ImpactArea(Enum):
+class ImpactArea(StrEnum):
     CORE_PRODUCT = "Core Product (you know, the thing that makes us money)"
     USER_EXPERIENCE = "User Experience (because happy users = happy life)"
     TECHNICAL_DEBT = "Technical Debt (the monster under our codebase)"
     INFRASTRUCTURE = "Infrastructure (keeping the lights on)"
     ANALYTICS = "Analytics (numbers that make executives happy)"
 
+# Score thresholds for P2, P1 and P0; a score equal to a threshold falls in the higher bucket
+_PRIORITY_THRESHOLDS = (40, 60, 80)
+_PRIORITY_BY_BUCKET = (Priority.P3, Priority.P2, Priority.P1, Priority.P0)
+
+# Impact areas in the order their scores are computed by _determine_impact_area
+_IMPACT_AREAS = (
+    ImpactArea.CORE_PRODUCT,
+    ImpactArea.USER_EXPERIENCE,
+    ImpactArea.TECHNICAL_DEBT,
+    ImpactArea.INFRASTRUCTURE,
+    ImpactArea.ANALYTICS
+)
+
+if np is not None:
+    # Impact area scores, matching _determine_impact_area; columns follow _IMPACT_AREAS.
+    # Complexity enters as 100 - complexity, hence the negative weights and offsets.
+    _IMPACT_WEIGHTS = np.array([
+        [1, 0, 0, 0, 0],
+        [0, 1, 0, 0, 0],
+        [0, 0, -1, -0.5, 0],
+        [0, 0, 0, 0.5, 1]
+    ])
+    _IMPACT_OFFSETS = np.array([0, 0, 100, 50, 0])
+
+_TAGLINES = (
+    "Let's make this our north star metric",
+    "This is a real game-changer",
+    "Time to move fast and fix things",
+    "This will definitely move the needle"
+)
+
+_DESCRIPTION_TEMPLATE = """
+{sarcastic_comment}
+
+🎯 OBJECTIVE
+{title}
+
+📝 DESCRIPTION
+{description}
+
+⚡ PRIORITY: {priority}
+{priority_justification}
+
+🎯 IMPACT AREA: {impact_area}
+
+🔑 ACCEPTANCE CRITERIA
+1. It actually works (wouldn't that be nice?)
+2. Has been tested (and not just on your local machine)
+3. Documentation exists (future us will thank present us)
+4. Metrics are tracked (because what gets measured gets managed™)
+
+💭 TERRY'S NOTES
+- Aligned with our Q{quarter} OKRs (which I'm sure everyone has memorized)
+- {tagline}
+- Remember: we're not just coding, we're "crafting digital experiences" 🎨
+
+Please don't hesitate to reach out if you need any clarification. My virtual door is always open! 
+
+Best regards,
+Terry 🤖
+Your friendly neighborhood AI PM
+"""
+
 @dataclass
 class Ticket:
     ticket_id: str
@@ -28,6 +105,8 @@ class Ticket:
 class ProductManager:
     def __init__(self, team_context: Dict[str, Any]):
         self.team_context = team_context
+        # Dedicated generator so ticket generation doesn't share the global random state
+        self._rng = random.Random()
         self.corporate_phrases = [
             "Let's circle back",
             "Synergize our efforts",
@@ -44,85 +123,50 @@ class ProductManager:
     def _generate_sarcastic_comment(self) -> str:
         """Generate a sarcastic corporate comment."""
         templates = [
-            f"As per my last {random.choice(['email', 'Slack', 'Teams message', 'carrier pigeon'])}...",
-            f"Let's {random.choice(self.corporate_phrases)} on this one.",
+            f"As per my last {self._rng.choice(['email', 'Slack', 'Teams message', 'carrier pigeon'])}...",
+            f"Let's {self._rng.choice(self.corporate_phrases)} on this one.",
             "I'm just trying to add value to the conversation here...",
             "Per our previous sync (that you definitely attended)...",
             "In the spirit of radical candor...",
             "Let me play devil's advocate here (as if we needed more devils)...",
         ]
-        return random.choice(templates)
+        return self._rng.choice(templates)
 
     def _determine_priority(self, context: Dict[str, int]) -> Priority:
         """Determine ticket priority based on context scores."""
+        # Weighted 40/30/20/10, summed in integer tenths so boundary scores compare exactly
         total_score = (
-            context['revenue_potential'] * 0.4 +
-            context['user_impact'] * 0.3 +
-            context['strategic_alignment'] * 0.2 +
-            (100 - context['technical_complexity']) * 0.1
-        )
-        
-        if total_score >= 80:
-            return Priority.P0
-        elif total_score >= 60:
-            return Priority.P1
-        elif total_score >= 40:
-            return Priority.P2
-        else:
-            return Priority.P3
+            context['revenue_potential'] * 4 +
+            context['user_impact'] * 3 +
+            context['strategic_alignment'] * 2 +
+            (100 - context['technical_complexity'])
+        ) / 10
+        return _PRIORITY_BY_BUCKET[bisect_right(_PRIORITY_THRESHOLDS, total_score)]
 
     def _determine_impact_area(self, context: Dict[str, int]) -> ImpactArea:
         """Determine the primary impact area based on context."""
-        scores = {
-            ImpactArea.CORE_PRODUCT: context['revenue_potential'],
-            ImpactArea.USER_EXPERIENCE: context['user_impact'],
-            ImpactArea.TECHNICAL_DEBT: context['technical_complexity'],
-            ImpactArea.INFRASTRUCTURE: (context['technical_complexity'] + context['strategic_alignment']) / 2,
-            ImpactArea.ANALYTICS: context['strategic_alignment']
-        }
-        return max(scores.items(), key=lambda x: x[1])[0]
+        # Scores follow the order of _IMPACT_AREAS; ties go to the earlier area
+        scores = (
+            context['revenue_potential'],
+            context['user_impact'],
+            context['technical_complexity'],
+            (context['technical_complexity'] + context['strategic_alignment']) / 2,
+            context['strategic_alignment']
+        )
+        return _IMPACT_AREAS[max(range(len(scores)), key=scores.__getitem__)]
 
     def _format_description(self, title: str, description: str, priority: Priority, impact_area: ImpactArea) -> str:
         """Format the ticket description with Terry's signature style."""
-        sarcastic_comment = self._generate_sarcastic_comment()
-        
-        template = f"""
-{sarcastic_comment}
-
-🎯 OBJECTIVE
-{title}
-
-📝 DESCRIPTION
-{description}
-
-⚡ PRIORITY: {priority.value}
-{self._generate_priority_justification(priority)}
-
-🎯 IMPACT AREA: {impact_area.value}
-
-🔑 ACCEPTANCE CRITERIA
-1. It actually works (wouldn't that be nice?)
-2. Has been tested (and not just on your local machine)
-3. Documentation exists (future us will thank present us)
-4. Metrics are tracked (because what gets measured gets managed™)
-
-💭 TERRY'S NOTES
-- Aligned with our Q{random.randint(1,4)} OKRs (which I'm sure everyone has memorized)
-- {random.choice([
-    "Let's make this our north star metric",
-    "This is a real game-changer",
-    "Time to move fast and fix things",
-    "This will definitely move the needle"
-])}
-- Remember: we're not just coding, we're "crafting digital experiences" 🎨
-
-Please don't hesitate to reach out if you need any clarification. My virtual door is always open! 
-
-Best regards,
-Terry 🤖
-Your friendly neighborhood AI PM
-"""
-        return template
+        return _DESCRIPTION_TEMPLATE.format_map({
+            'sarcastic_comment': self._generate_sarcastic_comment(),
+            'title': title,
+            'description': description,
+            'priority': priority.value,
+            'priority_justification': self._generate_priority_justification(priority),
+            'impact_area': impact_area.value,
+            'quarter': self._rng.randint(1, 4),
+            'tagline': self._rng.choice(_TAGLINES)
+        })
 
     def _generate_priority_justification(self, priority: Priority) -> str:
         """Generate a sarcastic justification for the priority level."""
@@ -136,9 +180,55 @@ Your friendly neighborhood AI PM
 
     def create_ticket(self, title: str, description: str, context: Dict[str, int]) -> Ticket:
         """Create a new ticket with Terry's special touch."""
-        ticket_id = f"TERRY-{uuid.uuid4().hex[:8].upper()}"
-        priority = self._determine_priority(context)
-        impact_area = self._determine_impact_area(context)
+        return self._build_ticket(
+            title,
+            description,
+            self._determine_priority(context),
+            self._determine_impact_area(context)
+        )
+
+    def create_tickets(self, rows: List[Tuple[str, str, Dict[str, int]]]) -> List[Ticket]:
+        """Create tickets for many (title, description, context) rows at once."""
+        if np is None or not rows:
+            return [self.create_ticket(*row) for row in rows]
+
+        # One row per ticket: revenue, user impact, 100 - complexity, strategic alignment
+        ctx = np.array([
+            [
+                context['revenue_potential'],
+                context['user_impact'],
+                100 - context['technical_complexity'],
+                context['strategic_alignment']
+            ]
+            for _, _, context in rows
+        ], dtype=np.float64)
+
+        # Same operations, in the same order, as _determine_priority so that
+        # scores on a threshold land in the same bucket
+        priority_scores = (
+            ctx[:, 0] * 4 +
+            ctx[:, 1] * 3 +
+            ctx[:, 3] * 2 +
+            ctx[:, 2]
+        ) / 10
+        priority_buckets = np.digitize(priority_scores, _PRIORITY_THRESHOLDS)
+        impact_indices = np.argmax(ctx @ _IMPACT_WEIGHTS + _IMPACT_OFFSETS, axis=1)
+
+        return [
+            self._build_ticket(
+                title,
+                description,
+                _PRIORITY_BY_BUCKET[bucket],
+                _IMPACT_AREAS[index]
+            )
+            for (title, description, _), bucket, index in zip(
+                rows, priority_buckets.tolist(), impact_indices.tolist()
+            )
+        ]
+
+    def _build_ticket(self, title: str, description: str, priority: Priority, impact_area: ImpactArea) -> Ticket:
+        """Assemble a ticket once its priority and impact area are known."""
+        ticket_id = f"TERRY-{os.urandom(4).hex().upper()}"
         
         formatted_description = self._format_description(
             title,
@@ -1,89 +1,238 @@
 import argparse
+import copy
+import hashlib
 import json
 import os
+import stat
 import sys
-import yaml
+import time
 import asyncio
+from functools import cached_property
 from typing import Optional, Dict, Any
-from dotenv import load_dotenv
 
-from pm import ProductManager, Priority, ImpactArea
-from llm_processor import OpenAIProcessor, LlamaProcessor, LLMProcessor
-from issue_trackers import IssueTrackerFactory
+# Heavy modules (pm, llm_processor, issue_trackers, yaml, dotenv) are imported
+# where they're used so commands only pay for what they need
 
-# Load environment variables from .env file
-load_dotenv()
+def _find_env_file() -> Optional[str]:
+    """Return the nearest .env in this script's directory or its parents, like find_dotenv."""
+    path = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        env_path = os.path.join(path, '.env')
+        if os.path.isfile(env_path):
+            return env_path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+# Load environment variables from the nearest .env, looking up from this script
+# so it applies whatever directory Terry is run from. dotenv is only imported
+# when there's a file to load.
+_ENV_PATH = _find_env_file()
+if _ENV_PATH:
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_PATH)
+
+# Cached LLM responses for previously seen ticket descriptions
+LLM_CACHE_DIR = os.path.expanduser("~/.terry_cache")
+LLM_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+def _load_yaml(f) -> Any:
+    """Parse YAML, using the libyaml-backed loader when available."""
+    import yaml
+    return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+def _dump_yaml(data: Any, f, **kwargs) -> None:
+    """Write YAML, using the libyaml-backed dumper when available."""
+    import yaml
+    yaml.dump(data, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), **kwargs)
+
+def _open_for_write(path: str, mode: int):
+    """Open path for writing with exactly the given permission bits."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        # os.open's mode is masked by the umask and ignored for existing files
+        os.chmod(path, mode)
+        return os.fdopen(fd, 'w')
+    except BaseException:
+        os.close(fd)
+        raise
+
+def _write_ticket(output_file: str, ticket_dict: Dict[str, Any], output_format: str) -> None:
+    """Save a ticket to disk as JSON or YAML."""
+    # Descriptions contain emoji, so don't depend on the locale's encoding
+    with open(output_file, 'w', encoding='utf-8') as f:
+        if output_format == 'json':
+            json.dump(ticket_dict, f, indent=2, ensure_ascii=False)
+        else:
+            _dump_yaml(ticket_dict, f, default_flow_style=False, sort_keys=False)
+
+def _read_llm_cache(cache_file: str) -> Optional[Dict[str, Any]]:
+    """Return a cached LLM response, or None if it's missing or expired."""
+    try:
+        if time.time() - os.path.getmtime(cache_file) > LLM_CACHE_TTL:
+            return None
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_llm_cache(cache_file: str, data: Dict[str, Any]) -> None:
+    """Atomically store an LLM response in the cache."""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_path = cache_file + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_file)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Failed to cache LLM response: {e}")
+
+# Context scores used to prioritize a ticket, each defaulting to 50
+_SCORE_KEYS = ('revenue_potential', 'user_impact', 'technical_complexity', 'strategic_alignment')
+
+_DEFAULT_CONFIG = {
+    'team_context': {
+        'current_sprint_focus': 'General Development',
+        'quarter_objectives': 'Improve Product Quality'
+    },
+    'llm_config': {
+        'provider': 'openai',
+        'model_path': None,
+        'api_key': None
+    },
+    'issue_tracker': {
+        'provider': None,  # 'github'
+        'repo': None      # for GitHub
+    }
+}
 
 class TerryCLI:
     def __init__(self):
         self.config_path = os.path.expanduser("~/.terry_config.yaml")
+        # Parsed copy of the YAML config, which is much faster to load
+        self.config_cache_path = os.path.expanduser("~/.terry_config.json")
         self.terry = None
         self.llm_processor = None
         self.issue_tracker = None
+        # Settings the current LLM processor / issue tracker were built from
+        self._llm_provider_key = None
+        self._issue_tracker_key = None
         self.config = {}  # Initialize empty config
         self.load_config()
 
     def get_default_config(self) -> Dict[str, Any]:
         """Get default configuration settings."""
-        return {
-            'team_context': {
-                'current_sprint_focus': 'General Development',
-                'quarter_objectives': 'Improve Product Quality'
-            },
-            'llm_config': {
-                'provider': 'openai',
-                'model_path': None,
-                'api_key': None
-            },
-            'issue_tracker': {
-                'provider': None,  # 'github'
-                'repo': None      # for GitHub
-            }
-        }
+        # Copied so callers can modify the result without touching the defaults
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
     def load_config(self) -> None:
         """Load team and project configuration."""
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    self.config = yaml.safe_load(f) or {}
-                    
-                    # Ensure all required sections exist
-                    default_config = self.get_default_config()
-                    if 'team_context' not in self.config:
-                        self.config['team_context'] = default_config['team_context']
-                    if 'llm_config' not in self.config:
-                        self.config['llm_config'] = default_config['llm_config']
-                    if 'issue_tracker' not in self.config:
-                        self.config['issue_tracker'] = default_config['issue_tracker']
-                    
-                    # Initialize components
-                    self.terry = ProductManager(team_context=self.config['team_context'])
-                    self.setup_llm_processor(self.config['llm_config'])
-                    self.setup_issue_tracker(self.config['issue_tracker'])
+            cached_config = self._load_config_cache()
+            if cached_config is not None:
+                self.config = cached_config
+                dirty = False
             else:
-                # Create default config
-                self.config = self.get_default_config()
-                with open(self.config_path, 'w') as f:
-                    yaml.dump(self.config, f)
-                self.terry = ProductManager(team_context=self.config['team_context'])
-                self.setup_llm_processor(self.config['llm_config'])
+                try:
+                    f = open(self.config_path, 'r')
+                except FileNotFoundError:
+                    # Create default config; written out below
+                    self.config = self.get_default_config()
+                    dirty = True
+                else:
+                    with f:
+                        self.config = _load_yaml(f) or {}
+                        
+                    # Ensure all required sections exist
+                    dirty = not _DEFAULT_CONFIG.keys() <= self.config.keys()
+                    self.config = self._merge_defaults(self.config)
                 
             # Save any updates made to config
-            with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f)
+            if dirty:
+                self._save_config()
+            elif cached_config is None:
+                self._save_config_cache()
                 
         except Exception as e:
             print(f"Error loading configuration: {e}")
             sys.exit(1)
 
+    def _merge_defaults(self, cfg: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in any top-level config sections missing from cfg with their defaults."""
+        for section, default in self.get_default_config().items():
+            cfg.setdefault(section, default)
+        return cfg
+
+    def init_components(self, need_terry: bool = False, need_llm: bool = False, need_tracker: bool = False) -> None:
+        """Initialize whichever of Terry, the LLM processor and the issue tracker a command needs."""
+        if need_terry and self.terry is None:
+            from pm import ProductManager
+            self.terry = ProductManager(team_context=self.config['team_context'])
+        if need_llm and self.llm_processor is None:
+            self.setup_llm_processor(self.config['llm_config'])
+        if need_tracker and self.issue_tracker is None:
+            self.setup_issue_tracker(self.config['issue_tracker'])
+
+    def _save_config(self) -> None:
+        """Atomically write the config to YAML and refresh the JSON cache."""
+        # Write through symlinks (e.g. a dotfiles repo) rather than replacing them
+        path = os.path.realpath(self.config_path)
+        # The config holds the API key, so keep the existing permissions or default to owner-only
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+        tmp_path = path + '.tmp'
+        with _open_for_write(tmp_path, mode) as f:
+            _dump_yaml(self.config, f)
+        os.replace(tmp_path, path)
+        self._save_config_cache()
+
+    def _load_config_cache(self) -> Optional[Dict[str, Any]]:
+        """Return the parsed config from the JSON cache if it matches the YAML file."""
+        try:
+            yaml_stat = os.stat(self.config_path)
+            with open(self.config_cache_path, 'r') as f:
+                # Treat a cache more readable than the YAML as stale so it gets rewritten
+                if stat.S_IMODE(os.fstat(f.fileno()).st_mode) != stat.S_IMODE(yaml_stat.st_mode):
+                    return None
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get('yaml_mtime_ns') != yaml_stat.st_mtime_ns:
+            return None
+        return cache.get('config')
+
+    def _save_config_cache(self) -> None:
+        """Write the parsed config to the JSON cache, tagged with the YAML file's mtime."""
+        try:
+            yaml_stat = os.stat(self.config_path)
+            cache = json.dumps({
+                'yaml_mtime_ns': yaml_stat.st_mtime_ns,
+                'config': self.config
+            })
+            # The cache holds the API key too, so it gets the YAML file's permissions
+            with _open_for_write(self.config_cache_path, stat.S_IMODE(yaml_stat.st_mode)) as f:
+                f.write(cache)
+        except (OSError, TypeError, ValueError):
+            # Config values JSON can't represent just mean no cache
+            pass
+
     def setup_issue_tracker(self, config: Dict[str, Any]) -> None:
         """Set up the issue tracker based on configuration."""
         provider = config.get('provider')
         if not provider:
             return  # No issue tracker configured
+
+        # Keep the existing tracker (and its HTTP session) if nothing relevant changed
+        tracker_key = (provider, config.get('repo'), config.get('team_id'))
+        if self.issue_tracker and self._issue_tracker_key == tracker_key:
+            return
+        self._issue_tracker_key = tracker_key
             
         try:
+            from issue_trackers import IssueTrackerFactory
             self.issue_tracker = IssueTrackerFactory.create_tracker(
                 provider,
                 repo=config.get('repo'),
@@ -98,19 +247,21 @@ class TerryCLI:
         print("\n🤖 Terry is analyzing your request...")
         
         try:
+            # The LLM is only set up by process_natural_language on a cache miss
+            self.init_components(need_terry=True, need_tracker=not args.no_tracker)
+
             # Process the natural language input
-            ticket_data = await self.process_natural_language(args.description)
+            ticket_data = await self.process_natural_language(
+                args.description,
+                use_cache=not args.no_llm_cache
+            )
             
             # Create the ticket using the processed data
+            scores = ticket_data.get('scores') or {}
             ticket = self.terry.create_ticket(
                 title=ticket_data.get('title', 'Untitled'),
                 description=ticket_data.get('description', args.description),
-                context={
-                    'revenue_potential': ticket_data.get('scores', {}).get('revenue_potential', 50),
-                    'user_impact': ticket_data.get('scores', {}).get('user_impact', 50),
-                    'technical_complexity': ticket_data.get('scores', {}).get('technical_complexity', 50),
-                    'strategic_alignment': ticket_data.get('scores', {}).get('strategic_alignment', 50)
-                }
+                context={key: scores.get(key, 50) for key in _SCORE_KEYS}
             )
 
             # Output ticket details
@@ -131,7 +282,7 @@ class TerryCLI:
                         'description': ticket.description,
                         'priority': ticket.priority.name,
                         'impact_area': ticket.impact_area.value,
-                        'scores': ticket_data.get('scores', {})
+                        'scores': scores
                     })
                     
                     if result['success']:
@@ -145,17 +296,16 @@ class TerryCLI:
 
             # Optional: Save ticket to a file
             if args.output:
-                output_file = f"{ticket.ticket_id}.yaml"
+                output_file = f"{ticket.ticket_id}.{args.output_format}"
                 ticket_dict = {
                     'id': ticket.ticket_id,
                     'title': ticket.title,
                     'priority': ticket.priority.name,
                     'impact_area': ticket.impact_area.value,
                     'description': ticket.description,
-                    'scores': ticket_data.get('scores', {})
+                    'scores': scores
                 }
-                with open(output_file, 'w') as f:
-                    yaml.dump(ticket_dict, f)
+                await asyncio.to_thread(_write_ticket, output_file, ticket_dict, args.output_format)
                 print(f"\n💾 Ticket saved to {output_file}")
                 
         except Exception as e:
@@ -170,19 +320,16 @@ class TerryCLI:
         """Update Terry's configuration."""
         try:
             # Load current config
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    self.config = yaml.safe_load(f) or {}
-            else:
+            try:
+                f = open(self.config_path, 'r')
+            except FileNotFoundError:
                 self.config = self.get_default_config()
+            else:
+                with f:
+                    self.config = _load_yaml(f) or {}
 
             # Ensure required sections exist
-            if 'team_context' not in self.config:
-                self.config['team_context'] = self.get_default_config()['team_context']
-            if 'llm_config' not in self.config:
-                self.config['llm_config'] = self.get_default_config()['llm_config']
-            if 'issue_tracker' not in self.config:
-                self.config['issue_tracker'] = self.get_default_config()['issue_tracker']
+            self.config = self._merge_defaults(self.config)
             
             # Update team context
             if args.sprint_focus:
@@ -205,22 +352,32 @@ class TerryCLI:
                 self.config['issue_tracker']['repo'] = args.github_repo
             
             # Save updated config
-            with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f)
+            self._save_config()
             
             print("✅ Configuration updated successfully!")
-            print("\nCurrent configuration:")
-            print(json.dumps(self.config, indent=2))
+            # Skip dumping the whole config when output is scripted
+            if sys.stdout.isatty() or args.verbose:
+                print("\nCurrent configuration:")
+                print(json.dumps(self.config, indent=2, default=str))
             
-            # Reinitialize components with new config
-            self.terry = ProductManager(team_context=self.config['team_context'])
-            self.setup_llm_processor(self.config['llm_config'])
-            self.setup_issue_tracker(self.config['issue_tracker'])
+            # Reinitialize components that are already in use with the new config
+            if self.terry is not None:
+                from pm import ProductManager
+                self.terry = ProductManager(team_context=self.config['team_context'])
+            if self.llm_processor is not None:
+                self.setup_llm_processor(self.config['llm_config'])
+            if self.issue_tracker is not None:
+                self.setup_issue_tracker(self.config['issue_tracker'])
             
         except Exception as e:
             print(f"Error updating configuration: {e}")
             sys.exit(1)
 
+    @cached_property
+    def parser(self) -> argparse.ArgumentParser:
+        """Command-line argument parser, built once per instance."""
+        return self.setup_cli()
+
     def setup_cli(self) -> argparse.ArgumentParser:
         """Set up command-line argument parser."""
         parser = argparse.ArgumentParser(
@@ -233,8 +390,12 @@ class TerryCLI:
         nl_parser.add_argument('description', help='Natural language description of the ticket')
         nl_parser.add_argument('-o', '--output', action='store_true', 
                              help='Save ticket to a file')
+        nl_parser.add_argument('--output-format', choices=['json', 'yaml'], default='json',
+                             help='File format used with --output (default: json)')
         nl_parser.add_argument('--no-tracker', action='store_true',
                              help='Skip creating issue in tracking system')
+        nl_parser.add_argument('--no-llm-cache', action='store_true',
+                             help='Ignore cached LLM responses for this description')
 
         # Traditional ticket creation
         ticket_parser = subparsers.add_parser('create', help='Create a new ticket')
@@ -277,6 +438,8 @@ class TerryCLI:
         config_parser.add_argument('--tracker-provider', choices=['github'],
                                  help='Set issue tracker provider')
         config_parser.add_argument('--github-repo', help='Set GitHub repository (org/repo)')
+        config_parser.add_argument('-v', '--verbose', action='store_true',
+                                 help='Print the resulting configuration even when not on a terminal')
 
         return parser
 
@@ -285,7 +448,8 @@ class TerryCLI:
         from issue_trackers import IssueCache, IssueTrackerFactory
         
         if args.cache_command == 'list':
-            cached_issues = IssueCache.list_cached_issues()
+            # Reading the cache directory is blocking I/O, so keep it off the event loop
+            cached_issues = await asyncio.to_thread(list, IssueCache.list_cached_issues())
             if not cached_issues:
                 print("No cached issues found.")
                 return
@@ -300,6 +464,7 @@ class TerryCLI:
                 print("-" * 40)
                 
         elif args.cache_command == 'retry':
+            self.init_components(need_tracker=True)
             if not self.issue_tracker:
                 print("❌ No issue tracker configured.")
                 return
@@ -322,73 +487,100 @@ class TerryCLI:
                     repo=tracker_config.get('repo')
                 )
                 
-                success_count = sum(1 for r in results if r['success'])
+                success_urls = []
+                failures = []
+                for result in results:
+                    if result['success']:
+                        success_urls.append(result['url'])
+                    else:
+                        failures.append(result)
+
                 print(f"\n📊 Retry Results:")
-                print(f"Successfully created: {success_count}/{len(results)} issues")
+                print(f"Successfully created: {len(success_urls)}/{len(results)} issues")
                 
-                if success_count > 0:
+                if success_urls:
                     print("\n✅ Successfully created issues:")
-                    for result in results:
-                        if result['success']:
-                            print(f"🔗 {result['url']}")
+                    for url in success_urls:
+                        print(f"🔗 {url}")
                 
-                if success_count < len(results):
+                if failures:
                     print("\n❌ Failed issues:")
-                    for result in results:
-                        if not result['success']:
-                            print(f"- {result['cache_file']}: {result['error']}")
-                            print(f"  Retry with: terry cache retry --file {result['cache_file']}")
+                    for result in failures:
+                        print(f"- {result['cache_file']}: {result['error']}")
+                        print(f"  Retry with: terry cache retry --file {result['cache_file']}")
             else:
                 print("Please specify --all to retry all issues or --file to retry a specific issue.")
 
     async def run_async(self, args):
         """Run the Terry CLI with async support."""
         if not args.command:
-            self.setup_cli().print_help()
+            self.parser.print_help()
             return
 
-        if args.command == 'nl':
-            await self.create_ticket_from_nl(args)
-        elif args.command == 'create':
-            self.create_ticket(args)
-        elif args.command == 'config':
-            self.update_config(args)
-        elif args.command == 'cache':
-            await self.handle_cache_command(args)
-
-    def run(self):
-        """Run the Terry CLI."""
-        parser = self.setup_cli()
-        args = parser.parse_args()
-        
-        # Run async commands in event loop
-        if args.command == 'nl':
-            asyncio.run(self.run_async(args))
-        else:
-            if args.command == 'create':
+        try:
+            if args.command == 'nl':
+                await self.create_ticket_from_nl(args)
+            elif args.command == 'create':
                 self.create_ticket(args)
             elif args.command == 'config':
                 self.update_config(args)
             elif args.command == 'cache':
-                asyncio.run(self.handle_cache_command(args))
-            else:
-                parser.print_help()
+                await self.handle_cache_command(args)
+        finally:
+            if self.issue_tracker:
+                await self.issue_tracker.close()
+
+    def run(self):
+        """Run the Terry CLI."""
+        args = self.parser.parse_args()
+        
+        # Every command is dispatched through a single event loop
+        asyncio.run(self.run_async(args))
 
-    async def process_natural_language(self, text: str) -> dict:
+    async def process_natural_language(self, text: str, use_cache: bool = True) -> dict:
         """Process natural language input using the configured LLM."""
+        # Responses are cached per LLM configuration and input text
+        llm_config = self.config.get('llm_config', {})
+        key = hashlib.blake2b(
+            f"{llm_config.get('provider')}\0{llm_config.get('model_path')}\0{text}".encode(),
+            digest_size=16
+        ).hexdigest()
+        cache_file = os.path.join(LLM_CACHE_DIR, f"{key}.json")
+
+        if use_cache:
+            cached = await asyncio.to_thread(_read_llm_cache, cache_file)
+            if cached is not None:
+                return cached
+
+        # Only load the model / API client once we know it's needed
+        self.init_components(need_llm=True)
         if not self.llm_processor:
             print("Error: LLM processor not configured")
             sys.exit(1)
         
         try:
-            return await self.llm_processor.process_input(text)
+            result = await self.llm_processor.process_input(text)
         except Exception as e:
             print(f"Error processing natural language input: {e}")
             sys.exit(1)
 
+        await asyncio.to_thread(_write_llm_cache, cache_file, result)
+        return result
+
     def setup_llm_processor(self, llm_config: dict) -> None:
         """Set up the LLM processor based on configuration."""
+        from llm_processor import OpenAIProcessor, LlamaProcessor
         provider = llm_config.get('provider', 'openai')
+
+        # Keep the existing processor (and its client or loaded model) if nothing relevant changed
+        provider_key = (
+            provider,
+            llm_config.get('api_key') or os.getenv("OPENAI_API_KEY"),
+            llm_config.get('model_path')
+        )
+        if self.llm_processor and self._llm_provider_key == provider_key:
+            return
+        self._llm_provider_key = provider_key
         
         try:
             if provider == 'openai':